@@ -4464,197 +4464,198 @@ class BuilderRibbon(ribbon.FrameRibbon):
     def __init__(self, parent):
         # initialize
         ribbon.FrameRibbon.__init__(self, parent)
+        # add controls (ribbon is laid out once when done)
+        with self.building():
+            # --- File ---
+            self.addSection(
+                "file", label=_translate("File"), icon="file"
+            )
+            # file new
+            self.addButton(
+                section="file", name="new", label=_translate("New"), icon="filenew",
+                tooltip=_translate("Create new experiment file"),
+                callback=parent.app.newBuilderFrame
+            )
+            # file open
+            self.addButton(
+                section="file", name="open", label=_translate("Open"), icon="fileopen",
+                tooltip=_translate("Open an existing experiment file"),
+                callback=parent.fileOpen
+            )
+            # file save
+            self.addButton(
+                section="file", name="save", label=_translate("Save"), icon="filesave",
+                tooltip=_translate("Save current experiment file"),
+                callback=parent.fileSave
+            )
+            # file save as
+            self.addButton(
+                section="file", name="saveas", label=_translate("Save as..."), icon="filesaveas",
+                tooltip=_translate("Save current experiment file as..."),
+                callback=parent.fileSaveAs
+            )
 
-        # --- File ---
-        self.addSection(
-            "file", label=_translate("File"), icon="file"
-        )
-        # file new
-        self.addButton(
-            section="file", name="new", label=_translate("New"), icon="filenew",
-            tooltip=_translate("Create new experiment file"),
-            callback=parent.app.newBuilderFrame
-        )
-        # file open
-        self.addButton(
-            section="file", name="open", label=_translate("Open"), icon="fileopen",
-            tooltip=_translate("Open an existing experiment file"),
-            callback=parent.fileOpen
-        )
-        # file save
-        self.addButton(
-            section="file", name="save", label=_translate("Save"), icon="filesave",
-            tooltip=_translate("Save current experiment file"),
-            callback=parent.fileSave
-        )
-        # file save as
-        self.addButton(
-            section="file", name="saveas", label=_translate("Save as..."), icon="filesaveas",
-            tooltip=_translate("Save current experiment file as..."),
-            callback=parent.fileSaveAs
-        )
-
-        self.addSeparator()
+            self.addSeparator()
 
-        # --- Edit ---
-        self.addSection(
-            "edit", label=_translate("Edit"), icon="edit"
-        )
-        # undo
-        self.addButton(
-            section="edit", name="undo", label=_translate("Undo"), icon="undo",
-            tooltip=_translate("Undo last action"),
-            callback=parent.undo
-        )
-        # redo
-        self.addButton(
-            section="edit", name="redo", label=_translate("Redo"), icon="redo",
-            tooltip=_translate("Redo last action"),
-            callback=parent.redo
-        )
+            # --- Edit ---
+            self.addSection(
+                "edit", label=_translate("Edit"), icon="edit"
+            )
+            # undo
+            self.addButton(
+                section="edit", name="undo", label=_translate("Undo"), icon="undo",
+                tooltip=_translate("Undo last action"),
+                callback=parent.undo
+            )
+            # redo
+            self.addButton(
+                section="edit", name="redo", label=_translate("Redo"), icon="redo",
+                tooltip=_translate("Redo last action"),
+                callback=parent.redo
+            )
 
-        self.addSeparator()
+            self.addSeparator()
 
-        # --- Tools ---
-        self.addSection(
-            "experiment", label=_translate("Experiment"), icon="experiment"
-        )
-        # monitor center
-        self.addButton(
-            section="experiment", name='monitor', label=_translate('Monitor center'),
-            icon="monitors",
-            tooltip=_translate("Monitor settings and calibration"),
-            callback=parent.app.openMonitorCenter
-        )
-        # settings
-        self.addButton(
-            section="experiment", name='expsettings', label=_translate('Experiment settings'), icon="expsettings",
-            tooltip=_translate("Edit experiment settings"),
-            callback=parent.setExperimentSettings
-        )
-        # switch run/pilot
-        self.addSwitchCtrl(
-            section="experiment", name="pyswitch",
-            labels=(_translate("Pilot"), _translate("Run")),
-            startMode=0, callback=parent.onRunModeToggle,
-            style=wx.HORIZONTAL
-        )
-        # send to runner
-        self.addButton(
-            section="experiment", name='sendRunner', label=_translate('Runner'), icon="runner",
-            tooltip=_translate("Send experiment to Runner"),
-            callback=parent.sendToRunner
-        )
-        # send to runner (pilot icon)
-        self.addButton(
-            section="experiment", name='pilotRunner', label=_translate('Runner'),
-            icon="runnerPilot",
-            tooltip=_translate("Send experiment to Runner"),
-            callback=parent.sendToRunner
-        )
+            # --- Tools ---
+            self.addSection(
+                "experiment", label=_translate("Experiment"), icon="experiment"
+            )
+            # monitor center
+            self.addButton(
+                section="experiment", name='monitor', label=_translate('Monitor center'),
+                icon="monitors",
+                tooltip=_translate("Monitor settings and calibration"),
+                callback=parent.app.openMonitorCenter
+            )
+            # settings
+            self.addButton(
+                section="experiment", name='expsettings', label=_translate('Experiment settings'), icon="expsettings",
+                tooltip=_translate("Edit experiment settings"),
+                callback=parent.setExperimentSettings
+            )
+            # switch run/pilot
+            self.addSwitchCtrl(
+                section="experiment", name="pyswitch",
+                labels=(_translate("Pilot"), _translate("Run")),
+                startMode=0, callback=parent.onRunModeToggle,
+                style=wx.HORIZONTAL
+            )
+            # send to runner
+            self.addButton(
+                section="experiment", name='sendRunner', label=_translate('Runner'), icon="runner",
+                tooltip=_translate("Send experiment to Runner"),
+                callback=parent.sendToRunner
+            )
+            # send to runner (pilot icon)
+            self.addButton(
+                section="experiment", name='pilotRunner', label=_translate('Runner'),
+                icon="runnerPilot",
+                tooltip=_translate("Send experiment to Runner"),
+                callback=parent.sendToRunner
+            )
 
-        self.addSeparator()
+            self.addSeparator()
 
-        # --- Python ---
-        self.addSection(
-            "py", label=_translate("Desktop"), icon="desktop"
-        )
-        # compile python
-        self.addButton(
-            section="py", name="pycompile", label=_translate('Write Python'), icon='compile_py',
-            tooltip=_translate("Write experiment as a Python script"),
-            callback=parent.compileScript
-        )
-        # pilot Py
-        self.addButton(
-            section="py", name="pypilot", label=_translate("Pilot"), icon='pyPilot',
-            tooltip=_translate("Run the current script in Python with piloting features on"),
-            callback=parent.pilotFile
-        )
-        # run Py
-        self.addButton(
-            section="py", name="pyrun", label=_translate("Run"), icon='pyRun',
-            tooltip=_translate("Run the current script in Python"),
-            callback=parent.runFile
-        )
+            # --- Python ---
+            self.addSection(
+                "py", label=_translate("Desktop"), icon="desktop"
+            )
+            # compile python
+            self.addButton(
+                section="py", name="pycompile", label=_translate('Write Python'), icon='compile_py',
+                tooltip=_translate("Write experiment as a Python script"),
+                callback=parent.compileScript
+            )
+            # pilot Py
+            self.addButton(
+                section="py", name="pypilot", label=_translate("Pilot"), icon='pyPilot',
+                tooltip=_translate("Run the current script in Python with piloting features on"),
+                callback=parent.pilotFile
+            )
+            # run Py
+            self.addButton(
+                section="py", name="pyrun", label=_translate("Run"), icon='pyRun',
+                tooltip=_translate("Run the current script in Python"),
+                callback=parent.runFile
+            )
 
-        self.addSeparator()
+            self.addSeparator()
 
-        # --- JS ---
-        self.addSection(
-            "browser", label=_translate("Browser"), icon="browser"
-        )
-        # compile JS
-        self.addButton(
-            section="browser", name="jscompile", label=_translate('Write JS'), icon='compile_js',
-            tooltip=_translate("Write experiment as a JavaScript (JS) script"),
-            callback=parent.fileExport
-        )
-        # pilot JS
-        self.addButton(
-            section="browser", name="jspilot", label=_translate("Pilot in browser"),
-            icon='jsPilot',
-            tooltip=_translate("Pilot experiment locally in your browser"),
-            callback=parent.onPavloviaDebug
-        )
-        # run JS
-        self.addButton(
-            section="browser", name="jsrun", label=_translate("Run on Pavlovia"), icon='jsRun',
-            tooltip=_translate("Run experiment on Pavlovia"),
-            callback=parent.onPavloviaRun
-        )
-        # sync project
-        self.addButton(
-            section="browser", name="pavsync", label=_translate("Sync"), icon='pavsync',
-            tooltip=_translate("Sync project with Pavlovia"),
-            callback=parent.onPavloviaSync
-        )
+            # --- JS ---
+            self.addSection(
+                "browser", label=_translate("Browser"), icon="browser"
+            )
+            # compile JS
+            self.addButton(
+                section="browser", name="jscompile", label=_translate('Write JS'), icon='compile_js',
+                tooltip=_translate("Write experiment as a JavaScript (JS) script"),
+                callback=parent.fileExport
+            )
+            # pilot JS
+            self.addButton(
+                section="browser", name="jspilot", label=_translate("Pilot in browser"),
+                icon='jsPilot',
+                tooltip=_translate("Pilot experiment locally in your browser"),
+                callback=parent.onPavloviaDebug
+            )
+            # run JS
+            self.addButton(
+                section="browser", name="jsrun", label=_translate("Run on Pavlovia"), icon='jsRun',
+                tooltip=_translate("Run experiment on Pavlovia"),
+                callback=parent.onPavloviaRun
+            )
+            # sync project
+            self.addButton(
+                section="browser", name="pavsync", label=_translate("Sync"), icon='pavsync',
+                tooltip=_translate("Sync project with Pavlovia"),
+                callback=parent.onPavloviaSync
+            )
 
-        self.addSeparator()
+            self.addSeparator()
 
-        # --- JS ---
-        self.addSection(
-            "pavlovia", label=_translate("Pavlovia"), icon="pavlovia"
-        )
-        # pavlovia user
-        self.addPavloviaUserCtrl(
-            section="pavlovia", name="pavuser", frame=parent
-        )
-        # pavlovia project
-        self.addPavloviaProjectCtrl(
-            section="pavlovia", name="pavproject", frame=parent
-        )
+            # --- JS ---
+            self.addSection(
+                "pavlovia", label=_translate("Pavlovia"), icon="pavlovia"
+            )
+            # pavlovia user
+            self.addPavloviaUserCtrl(
+                section="pavlovia", name="pavuser", frame=parent
+            )
+            # pavlovia project
+            self.addPavloviaProjectCtrl(
+                section="pavlovia", name="pavproject", frame=parent
+            )
 
-        self.addSeparator()
+            self.addSeparator()
 
-        # --- Plugin sections ---
-        self.addPluginSections("psychopy.app.builder")
+            # --- Plugin sections ---
+            self.addPluginSections("psychopy.app.builder")
 
-        # --- Views ---
-        self.addStretchSpacer()
-        self.addSeparator()
+            # --- Views ---
+            self.addStretchSpacer()
+            self.addSeparator()
 
-        self.addSection(
-            "views", label=_translate("Views"), icon="windows"
-        )
-        # show Builder
-        self.addButton(
-            section="views", name="builder", label=_translate("Show Builder"), icon="showBuilder",
-            tooltip=_translate("Switch to Builder view"),
-            callback=parent.app.showBuilder
-        ).Disable()
-        # show Coder
-        self.addButton(
-            section="views", name="coder", label=_translate("Show Coder"), icon="showCoder",
-            tooltip=_translate("Switch to Coder view"),
-            callback=parent.app.showCoder
-        )
-        # show Runner
-        self.addButton(
-            section="views", name="runner", label=_translate("Show Runner"), icon="showRunner",
-            tooltip=_translate("Switch to Runner view"),
-            callback=parent.app.showRunner
-        )
+            self.addSection(
+                "views", label=_translate("Views"), icon="windows"
+            )
+            # show Builder
+            self.addButton(
+                section="views", name="builder", label=_translate("Show Builder"), icon="showBuilder",
+                tooltip=_translate("Switch to Builder view"),
+                callback=parent.app.showBuilder
+            ).Disable()
+            # show Coder
+            self.addButton(
+                section="views", name="coder", label=_translate("Show Coder"), icon="showCoder",
+                tooltip=_translate("Switch to Coder view"),
+                callback=parent.app.showCoder
+            )
+            # show Runner
+            self.addButton(
+                section="views", name="runner", label=_translate("Show Runner"), icon="showRunner",
+                tooltip=_translate("Switch to Runner view"),
+                callback=parent.app.showRunner
+            )
 
 def extractText(stream):
     """Take a byte stream (or any file object of type b?) and return
@@ -2911,176 +2911,177 @@ class CoderRibbon(ribbon.FrameRibbon):
     def __init__(self, parent):
         # initialize
         ribbon.FrameRibbon.__init__(self, parent)
+        # add controls (ribbon is laid out once when done)
+        with self.building():
+            # --- File ---
+            self.addSection(
+                "file", label=_translate("File"), icon="file"
+            )
+            # file new
+            self.addButton(
+                section="file", name="new", label=_translate("New"), icon="filenew",
+                tooltip=_translate("Create new text file"),
+                callback=parent.fileNew
+            )
+            # file open
+            self.addButton(
+                section="file", name="open", label=_translate("Open"), icon="fileopen",
+                tooltip=_translate("Open an existing text file"),
+                callback=parent.fileOpen
+            )
+            # file save
+            self.addButton(
+                section="file", name="save", label=_translate("Save"), icon="filesave",
+                tooltip=_translate("Save current text file"),
+                callback=parent.fileSave
+            ).Disable()
+            # file save as
+            self.addButton(
+                section="file", name="saveas", label=_translate("Save as..."), icon="filesaveas",
+                tooltip=_translate("Save current text file as..."),
+                callback=parent.fileSaveAs
+            ).Disable()
+
+            self.addSeparator()
+
+            # --- Edit ---
+            self.addSection(
+                "edit", label=_translate("Edit"), icon="edit"
+            )
+            # undo
+            self.addButton(
+                section="edit", name="undo", label=_translate("Undo"), icon="undo",
+                tooltip=_translate("Undo last action"),
+                callback=parent.undo
+            )
+            # redo
+            self.addButton(
+                section="edit", name="redo", label=_translate("Redo"), icon="redo",
+                tooltip=_translate("Redo last action"),
+                callback=parent.redo
+            )
 
-        # --- File ---
-        self.addSection(
-            "file", label=_translate("File"), icon="file"
-        )
-        # file new
-        self.addButton(
-            section="file", name="new", label=_translate("New"), icon="filenew",
-            tooltip=_translate("Create new text file"),
-            callback=parent.fileNew
-        )
-        # file open
-        self.addButton(
-            section="file", name="open", label=_translate("Open"), icon="fileopen",
-            tooltip=_translate("Open an existing text file"),
-            callback=parent.fileOpen
-        )
-        # file save
-        self.addButton(
-            section="file", name="save", label=_translate("Save"), icon="filesave",
-            tooltip=_translate("Save current text file"),
-            callback=parent.fileSave
-        ).Disable()
-        # file save as
-        self.addButton(
-            section="file", name="saveas", label=_translate("Save as..."), icon="filesaveas",
-            tooltip=_translate("Save current text file as..."),
-            callback=parent.fileSaveAs
-        ).Disable()
-
-        self.addSeparator()
-
-        # --- Edit ---
-        self.addSection(
-            "edit", label=_translate("Edit"), icon="edit"
-        )
-        # undo
-        self.addButton(
-            section="edit", name="undo", label=_translate("Undo"), icon="undo",
-            tooltip=_translate("Undo last action"),
-            callback=parent.undo
-        )
-        # redo
-        self.addButton(
-            section="edit", name="redo", label=_translate("Redo"), icon="redo",
-            tooltip=_translate("Redo last action"),
-            callback=parent.redo
-        )
-
-        self.addSeparator()
+            self.addSeparator()
 
-        # --- Tools ---
-        self.addSection(
-            "experiment", label=_translate("Experiment"), icon="experiment"
-        )
-        # settings
-        self.addButton(
-            section="experiment", name='color', label=_translate('Color picker'), icon="color",
-            tooltip=_translate("Open a tool for choosing colors"),
-            callback=parent.app.colorPicker
-        )
-        # switch run/pilot
-        runPilotSwitch = self.addSwitchCtrl(
-            section="experiment", name="pyswitch",
-            labels=(_translate("Pilot"), _translate("Run")),
-            style=wx.HORIZONTAL
-        )
-        # send to runner
-        self.addButton(
-            section="experiment", name='sendRunner', label=_translate('Runner'), icon="runner",
-            tooltip=_translate("Send experiment to Runner"),
-            callback=parent.sendToRunner
-        ).Disable()
-        # send to runner (pilot icon)
-        self.addButton(
-            section="experiment", name='pilotRunner', label=_translate('Runner'),
-            icon="runnerPilot",
-            tooltip=_translate("Send experiment to Runner"),
-            callback=parent.sendToRunner
-        ).Disable()
-        # link runner buttons to switch
-        runPilotSwitch.addDependant(self.buttons['sendRunner'], mode=1, action="show")
-        runPilotSwitch.addDependant(self.buttons['pilotRunner'], mode=0, action="show")
-
-        self.addSeparator()
-
-        # --- Python ---
-        self.addSection(name="py", label=_translate("Desktop"), icon="desktop")
-
-        # monitor center
-        self.addButton(
-            section="py", name='monitor', label=_translate('Monitor center'), icon="monitors",
-            tooltip=_translate("Monitor settings and calibration"),
-            callback=parent.app.openMonitorCenter
-        )
-        # pilot Py
-        self.addButton(
-            section="py", name="pypilot", label=_translate("Pilot"), icon='pyPilot',
-            tooltip=_translate("Run the current script in Python with piloting features on"),
-            callback=parent.pilotFile
-        ).Disable()
-        # run Py
-        self.addButton(
-            section="py", name="pyrun", label=_translate("Run"), icon='pyRun',
-            tooltip=_translate("Run the current script in Python"),
-            callback=parent.runFile
-        ).Disable()
-        # link run buttons to switch
-        runPilotSwitch.addDependant(self.buttons['pyrun'], mode=1, action="show")
-        runPilotSwitch.addDependant(self.buttons['pypilot'], mode=0, action="show")
-
-        self.addSeparator()
-
-        # --- Browser ---
-        self.addSection(
-            name="browser", label=_translate("Browser"), icon="browser"
-        )
+            # --- Tools ---
+            self.addSection(
+                "experiment", label=_translate("Experiment"), icon="experiment"
+            )
+            # settings
+            self.addButton(
+                section="experiment", name='color', label=_translate('Color picker'), icon="color",
+                tooltip=_translate("Open a tool for choosing colors"),
+                callback=parent.app.colorPicker
+            )
+            # switch run/pilot
+            runPilotSwitch = self.addSwitchCtrl(
+                section="experiment", name="pyswitch",
+                labels=(_translate("Pilot"), _translate("Run")),
+                style=wx.HORIZONTAL
+            )
+            # send to runner
+            self.addButton(
+                section="experiment", name='sendRunner', label=_translate('Runner'), icon="runner",
+                tooltip=_translate("Send experiment to Runner"),
+                callback=parent.sendToRunner
+            ).Disable()
+            # send to runner (pilot icon)
+            self.addButton(
+                section="experiment", name='pilotRunner', label=_translate('Runner'),
+                icon="runnerPilot",
+                tooltip=_translate("Send experiment to Runner"),
+                callback=parent.sendToRunner
+            ).Disable()
+            # link runner buttons to switch
+            runPilotSwitch.addDependant(self.buttons['sendRunner'], mode=1, action="show")
+            runPilotSwitch.addDependant(self.buttons['pilotRunner'], mode=0, action="show")
+
+            self.addSeparator()
+
+            # --- Python ---
+            self.addSection(name="py", label=_translate("Desktop"), icon="desktop")
+
+            # monitor center
+            self.addButton(
+                section="py", name='monitor', label=_translate('Monitor center'), icon="monitors",
+                tooltip=_translate("Monitor settings and calibration"),
+                callback=parent.app.openMonitorCenter
+            )
+            # pilot Py
+            self.addButton(
+                section="py", name="pypilot", label=_translate("Pilot"), icon='pyPilot',
+                tooltip=_translate("Run the current script in Python with piloting features on"),
+                callback=parent.pilotFile
+            ).Disable()
+            # run Py
+            self.addButton(
+                section="py", name="pyrun", label=_translate("Run"), icon='pyRun',
+                tooltip=_translate("Run the current script in Python"),
+                callback=parent.runFile
+            ).Disable()
+            # link run buttons to switch
+            runPilotSwitch.addDependant(self.buttons['pyrun'], mode=1, action="show")
+            runPilotSwitch.addDependant(self.buttons['pypilot'], mode=0, action="show")
+
+            self.addSeparator()
+
+            # --- Browser ---
+            self.addSection(
+                name="browser", label=_translate("Browser"), icon="browser"
+            )
 
-        # sync project
-        self.addButton(
-            section="browser", name="pavsync", label=_translate("Sync"), icon='pavsync',
-            tooltip=_translate("Sync project with Pavlovia"),
-            callback=parent.onPavloviaSync
-        )
+            # sync project
+            self.addButton(
+                section="browser", name="pavsync", label=_translate("Sync"), icon='pavsync',
+                tooltip=_translate("Sync project with Pavlovia"),
+                callback=parent.onPavloviaSync
+            )
 
-        self.addSeparator()
+            self.addSeparator()
 
-        # --- Pavlovia ---
-        self.addSection(
-            name="pavlovia", label=_translate("Pavlovia"), icon="pavlovia"
-        )
-        # pavlovia user
-        self.addPavloviaUserCtrl(
-            section="pavlovia", name="pavuser", frame=parent
-        )
-        # pavlovia project
-        self.addPavloviaProjectCtrl(
-            section="pavlovia", name="pavproject", frame=parent
-        )
+            # --- Pavlovia ---
+            self.addSection(
+                name="pavlovia", label=_translate("Pavlovia"), icon="pavlovia"
+            )
+            # pavlovia user
+            self.addPavloviaUserCtrl(
+                section="pavlovia", name="pavuser", frame=parent
+            )
+            # pavlovia project
+            self.addPavloviaProjectCtrl(
+                section="pavlovia", name="pavproject", frame=parent
+            )
 
-        self.addSeparator()
+            self.addSeparator()
 
-        # --- Plugin sections ---
-        self.addPluginSections("psychopy.app.builder")
+            # --- Plugin sections ---
+            self.addPluginSections("psychopy.app.builder")
 
-        # --- Views ---
-        self.addStretchSpacer()
-        self.addSeparator()
+            # --- Views ---
+            self.addStretchSpacer()
+            self.addSeparator()
 
-        self.addSection(
-            "views", label=_translate("Views"), icon="windows"
-        )
-        # show Builder
-        self.addButton(
-            section="views", name="builder", label=_translate("Show Builder"), icon="showBuilder",
-            tooltip=_translate("Switch to Builder view"),
-            callback=parent.app.showBuilder
-        )
-        # show Coder
-        self.addButton(
-            section="views", name="coder", label=_translate("Show Coder"), icon="showCoder",
-            tooltip=_translate("Switch to Coder view"),
-            callback=parent.app.showCoder
-        ).Disable()
-        # show Runner
-        self.addButton(
-            section="views", name="runner", label=_translate("Show Runner"), icon="showRunner",
-            tooltip=_translate("Switch to Runner view"),
-            callback=parent.app.showRunner
-        )
+            self.addSection(
+                "views", label=_translate("Views"), icon="windows"
+            )
+            # show Builder
+            self.addButton(
+                section="views", name="builder", label=_translate("Show Builder"), icon="showBuilder",
+                tooltip=_translate("Switch to Builder view"),
+                callback=parent.app.showBuilder
+            )
+            # show Coder
+            self.addButton(
+                section="views", name="coder", label=_translate("Show Coder"), icon="showCoder",
+                tooltip=_translate("Switch to Coder view"),
+                callback=parent.app.showCoder
+            ).Disable()
+            # show Runner
+            self.addButton(
+                section="views", name="runner", label=_translate("Show Runner"), icon="showRunner",
+                tooltip=_translate("Switch to Runner view"),
+                callback=parent.app.showRunner
+            )
 
         # start off in run mode
         runPilotSwitch.setMode(1)
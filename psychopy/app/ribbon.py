@@ -1,3 +1,5 @@
+import contextlib
+import functools
 import sys
 import webbrowser
 from pathlib import Path
@@ -10,9 +12,140 @@ from psychopy.app import utils
 from psychopy.app import pavlovia_ui as pavui
 from psychopy.app.pavlovia_ui import sync
 from psychopy.app.themes import icons, handlers, colors
+from psychopy.app.themes import theme as appTheme
 from psychopy.localization import _translate
 from psychopy.projects import pavlovia
 
+# event type id for mouse entering a window, used to tell enter from leave in hover handlers
+_EVT_ENTER_WINDOW_ID = wx.EVT_ENTER_WINDOW.typeId
+
+
+def _setBackgroundColour(obj, colour):
+    """
+    Set the background colour of a window, skipping the call if the window already has that
+    colour.
+
+    Parameters
+    ----------
+    obj : wx.Window
+        Window to set the background colour of
+    colour : wx.Colour
+        Colour to set
+
+    Returns
+    -------
+    bool
+        True if the colour was changed, so the window needs refreshing
+    """
+    if obj.GetBackgroundColour() == colour:
+        return False
+    obj.SetBackgroundColour(colour)
+
+    return True
+
+
+def _setForegroundColour(obj, colour):
+    """
+    Set the foreground colour of a window, skipping the call if the window already has that
+    colour.
+
+    Parameters
+    ----------
+    obj : wx.Window
+        Window to set the foreground colour of
+    colour : wx.Colour
+        Colour to set
+
+    Returns
+    -------
+    bool
+        True if the colour was changed, so the window needs refreshing
+    """
+    if obj.GetForegroundColour() == colour:
+        return False
+    obj.SetForegroundColour(colour)
+
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _getButtonBitmap(stem, size, theme):
+    """
+    Get the bitmap for a ribbon button icon. Results are cached by stem, size and icon theme, so
+    each icon is only loaded from disk once per theme rather than once per button.
+
+    Parameters
+    ----------
+    stem : str
+        Stem of the icon file
+    size : int
+        Size (in pixels) of the bitmap
+    theme : str
+        Name of the icon theme to get the bitmap from
+
+    Returns
+    -------
+    wx.Bitmap
+        The icon bitmap
+    """
+    # if the icon is already in the icon cache, it may have been loaded under a different theme
+    fromCache = theme == appTheme.icons and stem in icons.iconCache
+    # create icon (loads from disk unless it's in the icon cache)
+    icon = icons.ButtonIcon(stem, size=size, theme=theme)
+    # only reload if we got it from the icon cache, otherwise it's just been loaded
+    if fromCache:
+        icon.reload(theme=theme)
+
+    return icon.bitmap
+
+
+@functools.lru_cache(maxsize=256)
+def _getBackedButtonBitmap(stem, size, theme, bg, disabled=False):
+    """
+    Get the bitmap for a ribbon button icon drawn centrally onto a solid background, so that a
+    button can change its background by swapping bitmaps rather than erasing and repainting.
+
+    Parameters
+    ----------
+    stem : str
+        Stem of the icon file
+    size : tuple[int]
+        Width and height (in pixels) of the bitmap, icon will be 32x32 within it
+    theme : str
+        Name of the icon theme to get the icon from
+    bg : tuple[int]
+        RGB values (0-255) of the background to draw the icon onto
+    disabled : bool
+        If True, draw the disabled (greyed out) version of the icon, so that the background isn't
+        greyed out along with it
+
+    Returns
+    -------
+    wx.Bitmap
+        The icon bitmap with an opaque background
+    """
+    w, h = size
+    # start off with a solid background
+    bmp = wx.Bitmap(w, h)
+    dc = wx.MemoryDC(bmp)
+    dc.SetBackground(wx.Brush(wx.Colour(*bg)))
+    dc.Clear()
+    # get icon (may be blank if there's no icon)
+    iconBmp = _getButtonBitmap(stem, 32, theme)
+    if iconBmp.IsOk():
+        if disabled:
+            iconBmp = iconBmp.ConvertToDisabled()
+        iw, ih = iconBmp.GetScaledWidth(), iconBmp.GetScaledHeight()
+        if iw > 32 or ih > 32:
+            # icon is bigger than it should be (e.g. a retina icon), so scale it rather than crop it
+            iw, ih = 32, 32
+            iconBmp = wx.Bitmap(iconBmp.ConvertToImage().Scale(iw, ih, wx.IMAGE_QUALITY_HIGH))
+        # draw icon (respecting its alpha) onto the middle of the background
+        dc.DrawBitmap(iconBmp, (w - iw) // 2, (h - ih) // 2, useMask=True)
+    dc.SelectObject(wx.NullBitmap)
+
+    return bmp
+
 
 class FrameRibbon(wx.Panel, handlers.ThemeMixin):
     """
@@ -27,6 +160,29 @@ class FrameRibbon(wx.Panel, handlers.ThemeMixin):
         # dicts in which to store sections and buttons
         self.sections = {}
         self.buttons = {}
+        # are controls currently being added (see `building`)?
+        self.isBuilding = False
+
+    @contextlib.contextmanager
+    def building(self):
+        """
+        Context manager for adding controls to the ribbon. Drawing and layout are suspended until
+        the `with` block exits, so that the ribbon is only laid out once rather than once per
+        control.
+
+        Usage::
+
+            with ribbon.building():
+                ribbon.addButton(...)
+        """
+        self.isBuilding = True
+        self.Freeze()
+        try:
+            yield self
+        finally:
+            self.isBuilding = False
+            self.Thaw()
+            self.Layout()
 
     def addSection(self, name, label=None, icon=None):
         """
@@ -240,8 +396,9 @@ class FrameRibbon(wx.Panel, handlers.ThemeMixin):
         sizer.AddStretchSpacer(prop=prop)
 
     def _applyAppTheme(self):
-        self.SetBackgroundColour(colors.app['frame_bg'])
-        self.Refresh()
+        # set color, refreshing only if it changed
+        if _setBackgroundColour(self, colors.app['frame_bg']):
+            self.Refresh()
 
 
 class FrameRibbonSection(wx.Panel, handlers.ThemeMixin):
@@ -273,9 +430,9 @@ class FrameRibbonSection(wx.Panel, handlers.ThemeMixin):
             self.labelSizer, border=6, flag=wx.ALIGN_CENTRE | wx.TOP
         )
         # add label icon
-        self._icon = icons.ButtonIcon(icon, size=16)
+        self.iconStem = icon
         self.icon = wx.StaticBitmap(
-            self, bitmap=self._icon.bitmap
+            self, bitmap=_getButtonBitmap(icon, 16, appTheme.icons)
         )
         if icon is None:
             self.icon.Hide()
@@ -296,6 +453,8 @@ class FrameRibbonSection(wx.Panel, handlers.ThemeMixin):
         # dict in which to store buttons
         self.buttons = {}
 
+        # icon theme the label icon is currently from
+        self._iconTheme = None
         self._applyAppTheme()
 
     def addButton(self, name, label="", icon=None, tooltip="", callback=None, style=wx.BU_NOTEXT):
@@ -410,13 +569,16 @@ class FrameRibbonSection(wx.Panel, handlers.ThemeMixin):
 
     def _applyAppTheme(self):
         # set color
-        self.SetBackgroundColour(colors.app['frame_bg'])
-        self.SetForegroundColour(colors.app['text'])
-        # set bitmaps again
-        self._icon.reload()
-        self.icon.SetBitmap(self._icon.bitmap)
-        # refresh
-        self.Refresh()
+        changed = _setBackgroundColour(self, colors.app['frame_bg'])
+        changed |= _setForegroundColour(self, colors.app['text'])
+        # set bitmaps again if icon theme has changed
+        if self._iconTheme != appTheme.icons:
+            self._iconTheme = appTheme.icons
+            self.icon.SetBitmap(_getButtonBitmap(self.iconStem, 16, appTheme.icons))
+            changed = True
+        # refresh if anything changed
+        if changed:
+            self.Refresh()
 
 
 class FrameRibbonPluginSection(FrameRibbonSection):
@@ -461,7 +623,8 @@ class FrameRibbonButton(wx.Button, handlers.ThemeMixin):
     def __init__(self, parent, label, icon=None, tooltip="", callback=None, style=wx.BU_NOTEXT):
         # figure out width
         w = -1
-        if style | wx.BU_NOTEXT == style:
+        self.iconOnly = style | wx.BU_NOTEXT == style
+        if self.iconOnly:
             w = 40
         # initialize
         wx.Button.__init__(self, parent, style=wx.BORDER_NONE | style, size=(w, 44))
@@ -474,38 +637,74 @@ class FrameRibbonButton(wx.Button, handlers.ThemeMixin):
             # if there's no label, include it in the tooltip
             tooltip = f"{label}: {tooltip}"
         self.SetToolTip(tooltip)
-        # set icon
-        self._icon = icons.ButtonIcon(icon, size=32)
+        # store icon stem
+        self.iconStem = icon
         bmpStyle = style & (wx.TOP | wx.BOTTOM | wx.LEFT | wx.RIGHT)
         # if given, bind callback
         if callback is not None:
             self.Bind(wx.EVT_BUTTON, callback)
-        # setup hover behaviour
-        self.Bind(wx.EVT_ENTER_WINDOW, self.onHover)
-        self.Bind(wx.EVT_LEAVE_WINDOW, self.onHover)
+        # setup hover behaviour (if there's no label, hover is handled by the bitmaps instead)
+        if not self.iconOnly:
+            self.Bind(wx.EVT_ENTER_WINDOW, self.onHover)
+            self.Bind(wx.EVT_LEAVE_WINDOW, self.onHover)
 
+        # icon theme and colors which the current bitmaps were made for
+        self._bmpKey = None
         self._applyAppTheme()
 
     def _applyAppTheme(self):
+        # store hover colors
+        self._bgNormal = colors.app['frame_bg']
+        self._bgHover = colors.app['panel_bg']
         # set color
-        self.SetBackgroundColour(colors.app['frame_bg'])
-        self.SetForegroundColour(colors.app['text'])
-        # set bitmaps again
-        self._icon.reload()
-        self.SetBitmap(self._icon.bitmap)
-        self.SetBitmapCurrent(self._icon.bitmap)
-        self.SetBitmapPressed(self._icon.bitmap)
-        self.SetBitmapFocus(self._icon.bitmap)
-        # refresh
-        self.Refresh()
+        changed = _setBackgroundColour(self, self._bgNormal)
+        changed |= _setForegroundColour(self, colors.app['text'])
+        # skip bitmaps if icon theme and colors are the same as when they were last set
+        bmpKey = (appTheme.icons, self._bgNormal.Get(False), self._bgHover.Get(False))
+        if bmpKey != self._bmpKey:
+            self._bmpKey = bmpKey
+            self._setBitmaps()
+            changed = True
+        # refresh if anything changed
+        if changed:
+            self.Refresh()
+
+    def _setBitmaps(self):
+        """
+        Set this button's bitmaps for the current icon theme and colors.
+        """
+        if self.iconOnly:
+            # if there's no label, bitmaps fill the button so draw the background into them
+            self._bmpNormal = _getBackedButtonBitmap(
+                self.iconStem, (40, 44), appTheme.icons, self._bgNormal.Get(False)
+            )
+            self._bmpHover = _getBackedButtonBitmap(
+                self.iconStem, (40, 44), appTheme.icons, self._bgHover.Get(False)
+            )
+            # wx would grey out the background along with the icon, so set disabled bitmap too
+            self.SetBitmapDisabled(_getBackedButtonBitmap(
+                self.iconStem, (40, 44), appTheme.icons, self._bgNormal.Get(False),
+                disabled=True
+            ))
+        else:
+            self._bmpNormal = self._bmpHover = _getButtonBitmap(
+                self.iconStem, 32, appTheme.icons
+            )
+        self.SetBitmap(self._bmpNormal)
+        if self.iconOnly:
+            # bitmaps fill the whole button (margins can only be set once there's a bitmap)
+            self.SetBitmapMargins(0, 0)
+        self.SetBitmapCurrent(self._bmpHover)
+        self.SetBitmapPressed(self._bmpHover)
+        self.SetBitmapFocus(self._bmpNormal)
 
     def onHover(self, evt):
-        if evt.EventType == wx.EVT_ENTER_WINDOW.typeId:
+        if evt.EventType == _EVT_ENTER_WINDOW_ID:
             # on hover, lighten background
-            self.SetBackgroundColour(colors.app['panel_bg'])
+            self.SetBackgroundColour(self._bgHover)
         else:
             # otherwise, keep same colour as parent
-            self.SetBackgroundColour(colors.app['frame_bg'])
+            self.SetBackgroundColour(self._bgNormal)
 
 
 class FrameRibbonDropdownButton(wx.Panel, handlers.ThemeMixin):
@@ -518,8 +717,8 @@ class FrameRibbonDropdownButton(wx.Panel, handlers.ThemeMixin):
         # make button
         self.button = wx.Button(self, label=label, style=wx.BORDER_NONE)
         self.sizer.Add(self.button, proportion=1, border=0, flag=wx.EXPAND | wx.ALL)
-        # set icon
-        self._icon = icons.ButtonIcon(icon, size=32)
+        # store icon stem
+        self.iconStem = icon
         # bind button callback
         if callback is not None:
             self.button.Bind(wx.EVT_BUTTON, callback)
@@ -537,6 +736,8 @@ class FrameRibbonDropdownButton(wx.Panel, handlers.ThemeMixin):
         self.drop.Bind(wx.EVT_ENTER_WINDOW, self.onHover)
         self.drop.Bind(wx.EVT_LEAVE_WINDOW, self.onHover)
 
+        # icon theme the button bitmaps are currently from
+        self._iconTheme = None
         self._applyAppTheme()
 
     def onMenu(self, evt):
@@ -551,26 +752,35 @@ class FrameRibbonDropdownButton(wx.Panel, handlers.ThemeMixin):
         self.PopupMenu(menu)
 
     def _applyAppTheme(self):
+        # store hover colors
+        self._bgNormal = colors.app['frame_bg']
+        self._bgHover = colors.app['panel_bg']
         # set color
+        fg = colors.app['text']
+        changed = False
         for obj in (self, self.button, self.drop):
-            obj.SetBackgroundColour(colors.app['frame_bg'])
-            obj.SetForegroundColour(colors.app['text'])
-        # set bitmaps again
-        self._icon.reload()
-        self.button.SetBitmap(self._icon.bitmap)
-        self.button.SetBitmapCurrent(self._icon.bitmap)
-        self.button.SetBitmapPressed(self._icon.bitmap)
-        self.button.SetBitmapFocus(self._icon.bitmap)
-        # refresh
-        self.Refresh()
+            changed |= _setBackgroundColour(obj, self._bgNormal)
+            changed |= _setForegroundColour(obj, fg)
+        # set bitmaps again if icon theme has changed
+        if self._iconTheme != appTheme.icons:
+            self._iconTheme = appTheme.icons
+            bmp = _getButtonBitmap(self.iconStem, 32, appTheme.icons)
+            self.button.SetBitmap(bmp)
+            self.button.SetBitmapCurrent(bmp)
+            self.button.SetBitmapPressed(bmp)
+            self.button.SetBitmapFocus(bmp)
+            changed = True
+        # refresh if anything changed
+        if changed:
+            self.Refresh()
 
     def onHover(self, evt):
-        if evt.EventType == wx.EVT_ENTER_WINDOW.typeId:
+        if evt.EventType == _EVT_ENTER_WINDOW_ID:
             # on hover, lighten background
-            evt.EventObject.SetBackgroundColour(colors.app['panel_bg'])
+            evt.EventObject.SetBackgroundColour(self._bgHover)
         else:
             # otherwise, keep same colour as parent
-            evt.EventObject.SetBackgroundColour(colors.app['frame_bg'])
+            evt.EventObject.SetBackgroundColour(self._bgNormal)
 
 
 EVT_RIBBON_SWITCH = wx.PyEventBinder(wx.IdManager.ReserveId())
@@ -643,6 +853,9 @@ class FrameRibbonSwitchCtrl(wx.Panel, handlers.ThemeMixin):
         self.icons = [
             icons.ButtonIcon(stem, size=size) for stem in stems
         ]
+        # store colors for active/inactive labels
+        self._fgActive = colors.app['text']
+        self._fgInactive = colors.app['rt_timegrid']
         # set starting mode
         self.setMode(startMode, silent=True)
         # bind callback
@@ -652,14 +865,19 @@ class FrameRibbonSwitchCtrl(wx.Panel, handlers.ThemeMixin):
         self.Layout()
 
     def _applyAppTheme(self):
-        self.SetBackgroundColour(colors.app['frame_bg'])
-        self.icon.SetBackgroundColour(colors.app['frame_bg'])
+        # store colors for active/inactive labels
+        self._fgActive = colors.app['text']
+        self._fgInactive = colors.app['rt_timegrid']
+        # set colors
+        bg = colors.app['frame_bg']
+        _setBackgroundColour(self, bg)
+        _setBackgroundColour(self.icon, bg)
         for mode, btn in enumerate(self.btns):
-            btn.SetBackgroundColour(colors.app['frame_bg'])
+            _setBackgroundColour(btn, bg)
             if mode == self.mode:
-                btn.SetForegroundColour(colors.app['text'])
+                btn.SetForegroundColour(self._fgActive)
             else:
-                btn.SetForegroundColour(colors.app['rt_timegrid'])
+                btn.SetForegroundColour(self._fgInactive)
 
     def onModeSwitch(self, evt):
         evtBtn = evt.GetEventObject()
@@ -684,9 +902,9 @@ class FrameRibbonSwitchCtrl(wx.Panel, handlers.ThemeMixin):
             # if it's the correct button...
             if btnMode == mode:
                 # style accordingly
-                btn.SetForegroundColour(colors.app['text'])
+                btn.SetForegroundColour(self._fgActive)
             else:
-                btn.SetForegroundColour(colors.app['rt_timegrid'])
+                btn.SetForegroundColour(self._fgInactive)
         # set icon
         self.icon.SetBitmap(self.icons[mode].bitmap)
 
@@ -708,18 +926,21 @@ class FrameRibbonSwitchCtrl(wx.Panel, handlers.ThemeMixin):
         # refresh
         self.Refresh()
         self.Update()
-        self.GetTopLevelParent().Layout()
+        # skip layout while the ribbon is being built, it's laid out once when finished
+        ribbon = getattr(self.parent, "ribbon", None)
+        if ribbon is None or not ribbon.isBuilding:
+            self.GetTopLevelParent().Layout()
 
     def onHover(self, evt):
-        if evt.EventType == wx.EVT_ENTER_WINDOW.typeId:
+        if evt.EventType == _EVT_ENTER_WINDOW_ID:
             # on hover, lighten background
-            evt.EventObject.SetForegroundColour(colors.app['text'])
+            evt.EventObject.SetForegroundColour(self._fgActive)
         else:
             # otherwise, keep same colour as parent
             if evt.EventObject is self.btns[self.mode]:
-                evt.EventObject.SetForegroundColour(colors.app['text'])
+                evt.EventObject.SetForegroundColour(self._fgActive)
             else:
-                evt.EventObject.SetForegroundColour(colors.app['rt_timegrid'])
+                evt.EventObject.SetForegroundColour(self._fgInactive)
 
     def addDependant(self, ctrl, mode, action="show"):
         """
@@ -770,12 +991,18 @@ class PavloviaUserCtrl(FrameRibbonDropdownButton):
         self._applyAppTheme()
     
     def _applyAppTheme(self):
+        # store hover colors
+        self._bgNormal = colors.app['frame_bg']
+        self._bgHover = colors.app['panel_bg']
         # set color
+        fg = colors.app['text']
+        changed = False
         for obj in (self, self.button, self.drop):
-            obj.SetBackgroundColour(colors.app['frame_bg'])
-            obj.SetForegroundColour(colors.app['text'])
-        # refresh
-        self.Refresh()
+            changed |= _setBackgroundColour(obj, self._bgNormal)
+            changed |= _setForegroundColour(obj, fg)
+        # refresh if anything changed
+        if changed:
+            self.Refresh()
 
     def onDelete(self, evt=None):
         i = self.frame.app.pavloviaButtons['user'].index(self)
@@ -859,7 +1086,7 @@ class PavloviaUserCtrl(FrameRibbonDropdownButton):
         self.button.SetBitmap(wx.Bitmap(icon))
 
         self.Layout()
-        if self.ribbon is not None:
+        if self.ribbon is not None and not self.ribbon.isBuilding:
             self.ribbon.Layout()
 
     def onEditPavloviaUser(self, evt=None):
@@ -907,12 +1134,18 @@ class PavloviaProjectCtrl(FrameRibbonDropdownButton):
         self._applyAppTheme()
     
     def _applyAppTheme(self):
+        # store hover colors
+        self._bgNormal = colors.app['frame_bg']
+        self._bgHover = colors.app['panel_bg']
         # set color
+        fg = colors.app['text']
+        changed = False
         for obj in (self, self.button, self.drop):
-            obj.SetBackgroundColour(colors.app['frame_bg'])
-            obj.SetForegroundColour(colors.app['text'])
-        # refresh
-        self.Refresh()
+            changed |= _setBackgroundColour(obj, self._bgNormal)
+            changed |= _setForegroundColour(obj, fg)
+        # refresh if anything changed
+        if changed:
+            self.Refresh()
 
     def onDelete(self, evt=None):
         i = self.frame.app.pavloviaButtons['project'].index(self)
@@ -962,7 +1195,7 @@ class PavloviaProjectCtrl(FrameRibbonDropdownButton):
             self.button.SetLabel(project['path_with_namespace'])
 
         self.Layout()
-        if self.ribbon is not None:
+        if self.ribbon is not None and not self.ribbon.isBuilding:
             self.ribbon.Layout()
 
     def onPavloviaSearch(self, evt=None):
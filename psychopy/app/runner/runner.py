@@ -1139,133 +1139,134 @@ class RunnerRibbon(ribbon.FrameRibbon):
     def __init__(self, parent):
         # initialize
         ribbon.FrameRibbon.__init__(self, parent)
+        # add controls (ribbon is laid out once when done)
+        with self.building():
+            # --- File ---
+            self.addSection(
+                "list", label=_translate("Manage list"), icon="file"
+            )
+            # add experiment
+            self.addButton(
+                section="list", name="add", label=_translate("Add"), icon="addExp",
+                tooltip=_translate("Add experiment to list"),
+                callback=parent.addTask
+            )
+            # remove experiment
+            self.addButton(
+                section="list", name="remove", label=_translate("Remove"), icon="removeExp",
+                tooltip=_translate("Remove experiment from list"),
+                callback=parent.removeTask
+            )
+            # save
+            self.addButton(
+                section="list", name="save", label=_translate("Save"), icon="filesaveas",
+                tooltip=_translate("Save task list to a file"),
+                callback=parent.parent.saveTaskList
+            )
+            # load
+            self.addButton(
+                section="list", name="open", label=_translate("Open"), icon="fileopen",
+                tooltip=_translate("Load tasks from a file"),
+                callback=parent.parent.loadTaskList
+            )
 
-        # --- File ---
-        self.addSection(
-            "list", label=_translate("Manage list"), icon="file"
-        )
-        # add experiment
-        self.addButton(
-            section="list", name="add", label=_translate("Add"), icon="addExp",
-            tooltip=_translate("Add experiment to list"),
-            callback=parent.addTask
-        )
-        # remove experiment
-        self.addButton(
-            section="list", name="remove", label=_translate("Remove"), icon="removeExp",
-            tooltip=_translate("Remove experiment from list"),
-            callback=parent.removeTask
-        )
-        # save
-        self.addButton(
-            section="list", name="save", label=_translate("Save"), icon="filesaveas",
-            tooltip=_translate("Save task list to a file"),
-            callback=parent.parent.saveTaskList
-        )
-        # load
-        self.addButton(
-            section="list", name="open", label=_translate("Open"), icon="fileopen",
-            tooltip=_translate("Load tasks from a file"),
-            callback=parent.parent.loadTaskList
-        )
-
-        self.addSeparator()
+            self.addSeparator()
 
-        # --- Tools ---
-        self.addSection(
-            "experiment", label=_translate("Experiment"), icon="experiment"
-        )
-        # switch run/pilot
-        runPilotSwitch = self.addSwitchCtrl(
-            section="experiment", name="pyswitch",
-            labels=(_translate("Pilot"), _translate("Run")),
-            callback=parent.onRunModeToggle,
-            style=wx.HORIZONTAL
-        )
+            # --- Tools ---
+            self.addSection(
+                "experiment", label=_translate("Experiment"), icon="experiment"
+            )
+            # switch run/pilot
+            runPilotSwitch = self.addSwitchCtrl(
+                section="experiment", name="pyswitch",
+                labels=(_translate("Pilot"), _translate("Run")),
+                callback=parent.onRunModeToggle,
+                style=wx.HORIZONTAL
+            )
 
-        self.addSeparator()
+            self.addSeparator()
 
-        # --- Python ---
-        self.addSection(
-            "py", label=_translate("Desktop"), icon="desktop"
-        )
-        # pilot Py
-        self.addButton(
-            section="py", name="pypilot", label=_translate("Pilot"), icon='pyPilot',
-            tooltip=_translate("Run the current script in Python with piloting features on"),
-            callback=parent.pilotLocal
-        ).Disable()
-        # run Py
-        self.addButton(
-            section="py", name="pyrun", label=_translate("Run"), icon='pyRun',
-            tooltip=_translate("Run the current script in Python"),
-            callback=parent.runLocal
-        ).Disable()
-        # stop
-        self.addButton(
-            section="py", name="pystop", label=_translate("Stop"), icon='stop',
-            tooltip=_translate("Stop the current (Python) script"),
-            callback=parent.stopTask
-        ).Disable()
-
-        self.addSeparator()
-
-        # --- JS ---
-        self.addSection(
-            "browser", label=_translate("Browser"), icon="browser"
-        )
-        # pilot JS
-        self.addButton(
-            section="browser", name="jspilot", label=_translate("Pilot in browser"),
-            icon='jsPilot',
-            tooltip=_translate("Pilot experiment locally in your browser"),
-            callback=parent.runOnlineDebug
-        ).Disable()
-        # run JS
-        self.addButton(
-            section="browser", name="jsrun", label=_translate("Run on Pavlovia"), icon='jsRun',
-            tooltip=_translate("Run experiment on Pavlovia"),
-            callback=parent.runOnline
-        ).Disable()
-
-        self.addSeparator()
-
-        # --- Pavlovia ---
-        self.addSection(
-            name="pavlovia", label=_translate("Pavlovia"), icon="pavlovia"
-        )
-        # pavlovia user
-        self.addPavloviaUserCtrl(
-            section="pavlovia", name="pavuser", frame=parent
-        )
+            # --- Python ---
+            self.addSection(
+                "py", label=_translate("Desktop"), icon="desktop"
+            )
+            # pilot Py
+            self.addButton(
+                section="py", name="pypilot", label=_translate("Pilot"), icon='pyPilot',
+                tooltip=_translate("Run the current script in Python with piloting features on"),
+                callback=parent.pilotLocal
+            ).Disable()
+            # run Py
+            self.addButton(
+                section="py", name="pyrun", label=_translate("Run"), icon='pyRun',
+                tooltip=_translate("Run the current script in Python"),
+                callback=parent.runLocal
+            ).Disable()
+            # stop
+            self.addButton(
+                section="py", name="pystop", label=_translate("Stop"), icon='stop',
+                tooltip=_translate("Stop the current (Python) script"),
+                callback=parent.stopTask
+            ).Disable()
+
+            self.addSeparator()
+
+            # --- JS ---
+            self.addSection(
+                "browser", label=_translate("Browser"), icon="browser"
+            )
+            # pilot JS
+            self.addButton(
+                section="browser", name="jspilot", label=_translate("Pilot in browser"),
+                icon='jsPilot',
+                tooltip=_translate("Pilot experiment locally in your browser"),
+                callback=parent.runOnlineDebug
+            ).Disable()
+            # run JS
+            self.addButton(
+                section="browser", name="jsrun", label=_translate("Run on Pavlovia"), icon='jsRun',
+                tooltip=_translate("Run experiment on Pavlovia"),
+                callback=parent.runOnline
+            ).Disable()
+
+            self.addSeparator()
+
+            # --- Pavlovia ---
+            self.addSection(
+                name="pavlovia", label=_translate("Pavlovia"), icon="pavlovia"
+            )
+            # pavlovia user
+            self.addPavloviaUserCtrl(
+                section="pavlovia", name="pavuser", frame=parent
+            )
 
-        self.addSeparator()
+            self.addSeparator()
 
-        # --- Plugin sections ---
-        self.addPluginSections("psychopy.app.builder")
+            # --- Plugin sections ---
+            self.addPluginSections("psychopy.app.builder")
 
-        # --- Views ---
-        self.addStretchSpacer()
-        self.addSeparator()
+            # --- Views ---
+            self.addStretchSpacer()
+            self.addSeparator()
 
-        self.addSection(
-            "views", label=_translate("Views"), icon="windows"
-        )
-        # show Builder
-        self.addButton(
-            section="views", name="builder", label=_translate("Show Builder"), icon="showBuilder",
-            tooltip=_translate("Switch to Builder view"),
-            callback=parent.app.showBuilder
-        )
-        # show Coder
-        self.addButton(
-            section="views", name="coder", label=_translate("Show Coder"), icon="showCoder",
-            tooltip=_translate("Switch to Coder view"),
-            callback=parent.app.showCoder
-        )
-        # show Runner
-        self.addButton(
-            section="views", name="runner", label=_translate("Show Runner"), icon="showRunner",
-            tooltip=_translate("Switch to Runner view"),
-            callback=parent.app.showRunner
-        ).Disable()
+            self.addSection(
+                "views", label=_translate("Views"), icon="windows"
+            )
+            # show Builder
+            self.addButton(
+                section="views", name="builder", label=_translate("Show Builder"), icon="showBuilder",
+                tooltip=_translate("Switch to Builder view"),
+                callback=parent.app.showBuilder
+            )
+            # show Coder
+            self.addButton(
+                section="views", name="coder", label=_translate("Show Coder"), icon="showCoder",
+                tooltip=_translate("Switch to Coder view"),
+                callback=parent.app.showCoder
+            )
+            # show Runner
+            self.addButton(
+                section="views", name="runner", label=_translate("Show Runner"), icon="showRunner",
+                tooltip=_translate("Switch to Runner view"),
+                callback=parent.app.showRunner
+            ).Disable()
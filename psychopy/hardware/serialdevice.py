@@ -9,6 +9,8 @@
 ports and check for the expected device
 """
 
+import io
+import re
 import sys
 import time
 
@@ -18,6 +20,9 @@ from psychopy.tools import systemtools as st
 from psychopy.tools.attributetools import AttributeGetSetMixin
 from .base import BaseDevice
 
+# matches a COM port reference like "(COM3)" in a Windows device description
+_comPortPattern = re.compile(r"COM(\d+)\)")
+
 
 def _findPossiblePorts():
     if sys.platform == 'win32':
@@ -26,20 +31,13 @@ def _findPossiblePorts():
         # get COM port for each device
         final = []
         for profile in profiles:
-            # find "COM" in profile description
-            desc = profile['Device Description']
-            start = desc.find("COM") + 3
-            end = desc.find(")", start)
+            # find COM port number in profile description
+            match = _comPortPattern.search(profile['Device Description'])
             # skip this profile if there's no reference to a COM port
-            if -1 in (start, end):
-                continue
-            # get COM port number
-            num = desc[start:end]
-            # skip this profile if COM port number doesn't look numeric
-            if not num.isnumeric():
+            if match is None:
                 continue
             # store COM port
-            final.append(f"COM{num}")
+            final.append(f"COM{match.group(1)}")
     else:
         # on linux and mac the options are too wide so use serial.tools
         from serial.tools import list_ports
@@ -233,7 +231,8 @@ class SerialDevice(BaseDevice, AttributeGetSetMixin):
         length : int
            One of:
            - 1: a single-line reply (use readline())
-           - 2: a multiline reply (use readlines() which *requires* timeout)
+           - 2: a multiline reply (read whatever is waiting in chunks until nothing more
+             arrives within timeout, then split into lines, keeping any trailing partial line)
            - -1: may not be any EOL character; just read whatever chars are there
         timeout : float
             How long to wait for a response before giving up
@@ -245,8 +244,14 @@ class SerialDevice(BaseDevice, AttributeGetSetMixin):
         if length == 1:
             retVal = self.com.readline()
         elif length > 1:
-            retVal = self.com.readlines()
-            retVal = [line.decode('utf-8') for line in retVal]
+            # read everything waiting in one go (rather than readlines(), which reads one byte at
+            # a time) until nothing more arrives within the timeout, then split into lines
+            data = bytearray()
+            chunk = self.com.read(self.com.inWaiting() or 1)
+            while chunk:
+                data.extend(chunk)
+                chunk = self.com.read(self.com.inWaiting() or 1)
+            retVal = [line.decode('utf-8') for line in io.BytesIO(data).readlines()]
         else:  # was -1?
             retVal = self.com.read(self.com.inWaiting())
         if type(retVal) is bytes:
@@ -0,0 +1,59 @@
+from psychopy.hardware.serialdevice import SerialDevice
+
+
+class _FakeCom:
+    """
+    Stands in for a serial.Serial, delivering data in bursts: inWaiting() reports what's left of
+    the current burst and read() returns b"" once everything has been read (i.e. a timeout)
+    """
+    def __init__(self, bursts):
+        self.bursts = list(bursts)
+        self.timeout = None
+        self.reads = 0
+
+    def inWaiting(self):
+        return len(self.bursts[0]) if self.bursts else 0
+
+    def read(self, size=1):
+        self.reads += 1
+        if not self.bursts:
+            return b""
+        chunk, self.bursts[0] = self.bursts[0][:size], self.bursts[0][size:]
+        if not self.bursts[0]:
+            self.bursts.pop(0)
+        return chunk
+
+    def close(self):
+        pass
+
+
+def _makeDevice(bursts):
+    # bypass __init__ so no port is opened
+    device = SerialDevice.__new__(SerialDevice)
+    device.com = _FakeCom(bursts)
+    device.name = "fake"
+    return device
+
+
+class TestGetResponseMultiline:
+    def test_lines_split_across_reads(self):
+        device = _makeDevice([b"first li", b"ne\r\nsecond\n", b"third\n"])
+        resp = device.getResponse(length=2, timeout=0.5)
+        assert resp == ["first line\r\n", "second\n", "third\n"]
+        assert device.com.timeout == 0.5
+
+    def test_trailing_partial_line_kept(self):
+        device = _makeDevice([b"done\nparti", b"al"])
+        assert device.getResponse(length=2) == ["done\n", "partial"]
+
+    def test_reads_in_chunks(self):
+        data = b"".join(b"line %i\n" % i for i in range(50))
+        device = _makeDevice([data])
+        resp = device.getResponse(length=2)
+        assert len(resp) == 50
+        # one read for the whole waiting buffer, one more to hit the timeout
+        assert device.com.reads == 2
+
+    def test_nothing_received(self):
+        device = _makeDevice([])
+        assert device.getResponse(length=2) == []
@@ -29,16 +29,36 @@ class TestingProtocol:
         self.messages = []
 
 
-def runInLiaison(server, protocol, obj, method, *args):
+def cancelPendingTasks(loop):
+    """
+    Cancel any tasks still pending on an event loop and wait for them to finish, as
+    `asyncio.run` does when it completes.
+    """
+    tasks = asyncio.all_tasks(loop)
+    if not tasks:
+        return
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def runInLiaison(server, protocol, obj, method, *args, loop=None):
     cmd = {'object': obj, 'method': method, 'args': args}
-    asyncio.run(
-        server._processMessage(protocol, json.dumps(cmd))
-    )
+    coro = server._processMessage(protocol, json.dumps(cmd))
+    # use the given event loop if there is one, otherwise make a new one for this call
+    if loop is None:
+        asyncio.run(coro)
+    else:
+        loop.run_until_complete(coro)
+        # don't let tasks scheduled by this call (e.g. broadcasts) carry over into later calls
+        cancelPendingTasks(loop)
 
 
 @skip_under_vm
 class TestLiaison:
     def setup_class(self):
+        # create one event loop to process all messages in
+        self.loop = asyncio.new_event_loop()
         # create liaison server
         self.server = liaison.WebSocketServer()
         self.protocol = TestingProtocol()
@@ -47,30 +67,61 @@ class TestLiaison:
         self.server.registerClass(session.Session, "session")
         runInLiaison(
             self.server, self.protocol, "session", "init",
-            str(Path(utils.TESTS_DATA_PATH) / "test_session" / "root")
+            str(Path(utils.TESTS_DATA_PATH) / "test_session" / "root"), loop=self.loop
         )
         runInLiaison(
-            self.server, self.protocol, "session", "registerMethods"
+            self.server, self.protocol, "session", "registerMethods", loop=self.loop
         )
         # add device manager to liaison server
         self.server.registerClass(hardware.DeviceManager, "DeviceManager")
         runInLiaison(
-            self.server, self.protocol, "DeviceManager", "init"
+            self.server, self.protocol, "DeviceManager", "init", loop=self.loop
         )
         runInLiaison(
-            self.server, self.protocol, "DeviceManager", "registerMethods"
+            self.server, self.protocol, "DeviceManager", "registerMethods", loop=self.loop
         )
         # start Liaison
         self.server.run("localhost", 8100)
         # start session
         runInLiaison(
-            self.server, self.protocol, "session", "start"
+            self.server, self.protocol, "session", "start", loop=self.loop
         )
         # setup window
         runInLiaison(
-            self.server, self.protocol, "session", "setupWindowFromParams", "{}", "false"
+            self.server, self.protocol, "session", "setupWindowFromParams", "{}", "false",
+            loop=self.loop
         )
 
+    def teardown_class(self):
+        # clean up and close event loop
+        cancelPendingTasks(self.loop)
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.loop.close()
+
+    def _waitFor(self, nBefore, predicate, timeout=5):
+        """
+        Keep the event loop running until a message newer than the first `nBefore` satisfies a
+        given condition, failing if none does before the timeout is reached.
+
+        Parameters
+        ----------
+        nBefore : int
+            How many messages had been received before the call whose reply we're waiting on
+        predicate : function
+            Function which takes the latest received message and returns True when done waiting
+        timeout : float
+            Maximum time (s) to wait for
+        """
+        start = time.time()
+        msgs = self.protocol.messages
+        while not (len(msgs) > nBefore and predicate(msgs[-1])):
+            if time.time() - start > timeout:
+                raise TimeoutError(
+                    f"No matching Liaison message received within {timeout}s, last messages: "
+                    f"{msgs[nBefore:]}"
+                )
+            self.loop.run_until_complete(asyncio.sleep(0.01))
+
     def test_session_init(self):
         assert "session" in self.server._methods
         assert isinstance(self.server._methods['session'][0], session.Session)
@@ -80,25 +131,30 @@ class TestLiaison:
         assert isinstance(self.server._methods['DeviceManager'][0], hardware.DeviceManager)
 
     def test_basic_experiment(self):
+        nMsgs = len(self.protocol.messages)
         runInLiaison(
             self.server, self.protocol, "session", "addExperiment",
-            "exp1/exp1.psyexp", "exp1"
+            "exp1/exp1.psyexp", "exp1", loop=self.loop
         )
-        time.sleep(1)
+        self._waitFor(nMsgs, lambda msg: "result" in msg)
         runInLiaison(
             self.server, self.protocol, "session", "runExperiment",
-            "exp1"
+            "exp1", loop=self.loop
         )
     
     def test_future_trials(self):
+        nMsgs = len(self.protocol.messages)
         # add experiment
         runInLiaison(
             self.server, self.protocol, "session", "addExperiment",
-            "testFutureTrials/testFutureTrials.psyexp", "testFutureTrials"
+            "testFutureTrials/testFutureTrials.psyexp", "testFutureTrials",
+            loop=self.loop
         )
-        time.sleep(1)
+        self._waitFor(nMsgs, lambda msg: "result" in msg)
         # define a threaded task to run alongside experiment
         def _thread():
+            # main loop will be busy running the experiment, so make one for this thread
+            loop = asyncio.new_event_loop()
             # wait for first meaningful result
             resp = None
             i = 0
@@ -106,7 +162,7 @@ class TestLiaison:
                 # get future trial
                 runInLiaison(
                     self.server, self.protocol, "session", "getFutureTrial",
-                    "1", "True"
+                    "1", "True", loop=loop
                 )
                 # get result
                 resp = json.loads(self.protocol.messages[-1]["result"])
@@ -114,6 +170,8 @@ class TestLiaison:
                 time.sleep(0.1)
                 # iterate towards limit
                 i += 1
+            cancelPendingTasks(loop)
+            loop.close()
             # if we hit iteration limit, fail
             assert i < 24, "Timed out waiting for a non-None result from getFutureTrial"
             # does response have all the keys we expect?
@@ -133,23 +191,24 @@ class TestLiaison:
         # run experiment
         runInLiaison(
             self.server, self.protocol, "session", "runExperiment",
-            "testFutureTrials"
+            "testFutureTrials", loop=self.loop
         )
 
     def test_experiment_error(self):
         """
         Test that an error in an experiment is sent to Liaison properly
         """
+        nMsgs = len(self.protocol.messages)
         # run an experiment with an error in it
         runInLiaison(
             self.server, self.protocol, "session", "addExperiment",
-            "error/error.psyexp", "error"
+            "error/error.psyexp", "error", loop=self.loop
         )
-        time.sleep(1)
+        self._waitFor(nMsgs, lambda msg: "result" in msg)
         try:
             runInLiaison(
                 self.server, self.protocol, "session", "runExperiment",
-                "error"
+                "error", loop=self.loop
             )
         except RuntimeError as err:
             # we expect an error from this experiment, so don't crash the whole process
@@ -161,24 +220,26 @@ class TestLiaison:
         # add keyboard
         runInLiaison(
             self.server, self.protocol, "DeviceManager", "addDevice",
-            "psychopy.hardware.keyboard.KeyboardDevice", "defaultKeyboard"
+            "psychopy.hardware.keyboard.KeyboardDevice", "defaultKeyboard", loop=self.loop
         )
         # get keyboard from device manager
         kb = hardware.DeviceManager.getDevice("defaultKeyboard")
         # make sure we got it
         from psychopy.hardware.keyboard import KeyboardDevice, KeyPress
         assert isinstance(kb, KeyboardDevice)
+        nMsgs = len(self.protocol.messages)
         # add listener
         runInLiaison(
             self.server, self.protocol, "DeviceManager", "addListener",
-            "defaultKeyboard", "liaison", "True"
+            "defaultKeyboard", "liaison", "True", loop=self.loop
         )
-        time.sleep(1)
+        self._waitFor(nMsgs, lambda msg: "result" in msg)
+        nMsgs = len(self.protocol.messages)
         # send dummy message
         kb.receiveMessage(
             KeyPress("a", 1234)
         )
-        time.sleep(1)
+        self._waitFor(nMsgs, lambda msg: msg.get('type') == "hardware_response")
         # check that message was sent to Liaison
         lastMsg = self.protocol.messages[-1]
         assert lastMsg['type'] == "hardware_response"
@@ -195,7 +256,7 @@ class TestLiaison:
         runInLiaison(
             self.server, self.protocol, "DeviceManager", "addDevice",
             "psychopy.hardware.photodiode.ScreenBufferSampler", "screenBuffer",
-            "session.win"
+            "session.win", loop=self.loop
         )
         # get screen buffer photodidoe
         device = DeviceManager.getDevice("screenBuffer")
@@ -212,27 +273,27 @@ class TestLiaison:
         # add experiment which creates a button box with different buttons
         runInLiaison(
             self.server, self.protocol, "session", "addExperiment",
-            "testNamedButtonBox/testNamedButtonBox.psyexp", "testNamedButtonBox"
+            "testNamedButtonBox/testNamedButtonBox.psyexp", "testNamedButtonBox", loop=self.loop
         )
         # setup generic devices (use exp1 as a template)
         runInLiaison(
             self.server, self.protocol, "session", "addExperiment",
-            "exp1/exp1.psyexp", "exp1"
+            "exp1/exp1.psyexp", "exp1", loop=self.loop
         )
         runInLiaison(
             self.server, self.protocol, "session", "setupDevicesFromExperiment",
-            "exp1"
+            "exp1", loop=self.loop
         )
         # add keyboard button box with abc as its buttons
         runInLiaison(
             self.server, self.protocol, "DeviceManager", "addDevice",
             "psychopy.hardware.button.KeyboardButtonBox", "testNamedButtonBox",
-            '["a", "b", "c"]'
+            '["a", "b", "c"]', loop=self.loop
         )
         # run experiment
         runInLiaison(
             self.server, self.protocol, "session", "runExperiment",
-            "testNamedButtonBox"
+            "testNamedButtonBox", loop=self.loop
         )
 
     def test_device_JSON(self):
@@ -254,7 +315,7 @@ class TestLiaison:
             # call getDevice from Liaison
             runInLiaison(
                 self.server, self.protocol, "DeviceManager", "getDevice",
-                deviceName
+                deviceName, loop=self.loop
             )
             # get message
             result = self.protocol.messages[-1]['result']
@@ -262,13 +323,14 @@ class TestLiaison:
             json.loads(result)
 
     def test_device_error(self):
+        nMsgs = len(self.protocol.messages)
         # add a device in a way which will trigger an error
         runInLiaison(
             self.server, self.protocol, "DeviceManager", "addDevice",
             "psychopy.hardware.keyboard.KeyboardDevice", "testWrongKeyboard",
-            "-1", "wrong", "wrong", "wrong",
+            "-1", "wrong", "wrong", "wrong", loop=self.loop
         )
-        time.sleep(1)
+        self._waitFor(nMsgs, lambda msg: msg.get('type') == "hardware_error")
         # make sure error looks correct in JSON format
         result = self.protocol.messages[-1]
         assert result['type'] == "hardware_error"
@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import pytest
+serial = pytest.importorskip("serial")
+
+from psychopy.tools import systemtools as st
+
+
+class _FakeSerial:
+    """
+    Stands in for serial.Serial, only COM1 and COM2 can be opened and each construction is counted
+    """
+    opened = 0
+
+    def __init__(self, name):
+        if name not in ("COM1", "COM2"):
+            raise serial.SerialException(name)
+        _FakeSerial.opened += 1
+        self.port = name
+        self.baudrate = 9600
+        self.bytesize = 8
+        self.parity = 'N'
+        self.stopbits = 1
+        self.xonxoff = False
+        self.rtscts = False
+        self.dsrdtr = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class TestGetSerialPortsCache:
+    def setup_method(self):
+        st._serialPortCache = None
+        _FakeSerial.opened = 0
+        self.now = 100.0
+        self.patches = [
+            patch("serial.Serial", _FakeSerial),
+            patch.object(st.platform, "system", return_value="Windows"),
+            patch.object(st.time, "monotonic", side_effect=lambda: self.now),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def teardown_method(self):
+        for p in self.patches:
+            p.stop()
+        st._serialPortCache = None
+
+    def _enumerations(self):
+        # each enumeration opens COM1 and COM2
+        return _FakeSerial.opened // 2
+
+    def test_cached_within_window(self):
+        first = st.getSerialPorts()
+        assert [port['port'] for port in first] == ["COM1", "COM2"]
+        assert self._enumerations() == 1
+        # a second call inside the window reuses the last result
+        self.now += st.SERIAL_PORT_CACHE_DURATION / 2
+        assert st.getSerialPorts() == first
+        assert self._enumerations() == 1
+        # ...but once it has expired, ports are enumerated again
+        self.now += st.SERIAL_PORT_CACHE_DURATION
+        st.getSerialPorts()
+        assert self._enumerations() == 2
+
+    def test_refresh(self):
+        st.getSerialPorts()
+        st.getSerialPorts(refresh=True)
+        assert self._enumerations() == 2
+
+    def test_returns_copies(self):
+        first = st.getSerialPorts()
+        first[0]['baudrate'] = 115200
+        first.pop()
+        second = st.getSerialPorts()
+        assert self._enumerations() == 1
+        assert len(second) == 2
+        assert second[0]['baudrate'] == 9600
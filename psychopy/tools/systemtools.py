@@ -44,6 +44,7 @@ import os
 import glob
 import subprocess as sp
 import json
+import time
 from psychopy.preferences import prefs
 from psychopy import logging
 
@@ -67,6 +68,7 @@ CAMERA_NULL_VALUE = u'Null'  # fields where we couldn't get a value
 AUDIO_LIBRARY_PTB = 'ptb'  # PsychPortAudio from Psychtoolbox
 
 SERIAL_MAX_ENUM_PORTS = 32  # can be as high as 256 on Win32, not used on Unix
+SERIAL_PORT_CACHE_DURATION = 2.0  # seconds to reuse the result of `getSerialPorts()`
 
 
 # ------------------------------------------------------------------------------
@@ -692,7 +694,14 @@ def getKeyboards():
 # Connectivity
 #
 
-def getSerialPorts():
+# Cache data from the last call of `getSerialPorts()`, as enumerating ports
+# means trying to open each one. This is only reused for a short time (see
+# `SERIAL_PORT_CACHE_DURATION`) so that newly connected devices still appear.
+
+_serialPortCache = None  # cache for serial ports, as (timestamp, ports)
+
+
+def getSerialPorts(refresh=False):
     """Get serial ports attached to this system.
 
     Serial ports are used for inter-device communication using the RS-232/432
@@ -709,6 +718,15 @@ def getSerialPorts():
     same name or enum index when a device is connected or after a system
     reboot.
 
+    Enumerating ports is slow, so the result is reused for calls made within
+    `SERIAL_PORT_CACHE_DURATION` seconds of each other.
+
+    Parameters
+    ----------
+    refresh : bool
+        Whether to enumerate the ports again even if a recent result is
+        cached. Default is `False`.
+
     Returns
     -------
     dict
@@ -753,6 +771,12 @@ def getSerialPorts():
         }
 
     """
+    global _serialPortCache  # use the global cache
+    if not refresh and _serialPortCache is not None:
+        cacheTime, cachedPorts = _serialPortCache
+        if time.monotonic() - cacheTime < SERIAL_PORT_CACHE_DURATION:
+            return [dict(portConf) for portConf in cachedPorts]
+
     try:
         import serial  # pyserial
     except ImportError:
@@ -802,7 +826,9 @@ def getSerialPorts():
             # no port found with `name` or cannot be opened
             pass
 
-    return toReturn
+    _serialPortCache = (time.monotonic(), toReturn)  # update the cache
+
+    return [dict(portConf) for portConf in toReturn]
 
 
 # ------------------------------------------------------------------------------
@@ -1301,7 +1327,7 @@ def getInstalledDevices(deviceType='all', refresh=False):
         toReturn = {}
         toReturn.update(_getInstalledAudioDevices())  # audio devices
         toReturn.update({'keyboard': getKeyboards()})  # keyboards 
-        toReturn.update({'serial': getSerialPorts()})  # serial ports
+        toReturn.update({'serial': getSerialPorts(refresh=True)})  # serial ports
         if not platform.system().startswith('Linux'):  # cameras
             toReturn.update(_getInstalledCameras())
         else: